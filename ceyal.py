@@ -10,16 +10,22 @@ def parse_datetime(datetime_str):
     if not datetime_str:
         return None
     try:
-        return dt.datetime.fromisoformat(datetime_str)
+        return dt.datetime.fromisoformat(datetime_str).timestamp()
     except ValueError:
         try:
-            return dt.datetime.strptime(datetime_str, "%Y-%m-%d")
+            return dt.datetime.strptime(datetime_str, "%Y-%m-%d").timestamp()
         except ValueError:
             print(f"Error: Could not parse date '{datetime_str}'. Use 'YYYY-MM-DDTHH:mm:ss.sssZ' or ISO 8601 format.")
             sys.exit(1)
 
+def format_datetime(timestamp):
+    # tasks keep epoch seconds; only turn them into datetimes for display
+    if timestamp is None:
+        return None
+    return dt.datetime.fromtimestamp(timestamp)
+
 def find_task_by_partial(tm, partial_id):
-    matches = [tid for tid in tm.tasks if tid.startswith(partial_id)]
+    matches = tm.ids_with_prefix(partial_id)
     
     if len(matches) == 0:
         print(f"Error: No task found starting with '{partial_id}'")
@@ -35,7 +41,7 @@ def handle_add(args, tm):
     d_time = parse_datetime(args.dead)
     # If no target provided, default to tomorrow
     if not t_time:
-        t_time = dt.datetime.now() + dt.timedelta(days=1)
+        t_time = (dt.datetime.now() + dt.timedelta(days=1)).timestamp()
         
     tm.add(args.name, target_time=t_time, desc=args.desc, dead_time=d_time)
 
@@ -49,9 +55,7 @@ def handle_remove(args, tm):
     if args.all:
         confirm = input("Are you sure you want to DELETE ALL tasks? (y/n): ")
         if confirm.lower() == 'y':
-            all_ids = list(tm.tasks.keys())
-            for tid in all_ids:
-                tm.remove(tid)
+            tm.clear()
             print("All tasks cleared.")
     else:
         if not args.id:
@@ -63,6 +67,7 @@ def handle_remove(args, tm):
 
 def handle_state_change(args, tm):
     task = find_task_by_partial(tm, args.id)
+    before = task.status
     
     if args.command == 'start':
         task.start()
@@ -73,6 +78,10 @@ def handle_state_change(args, tm):
     elif args.command == 'complete':
         task.complete()
 
+    # every successful transition changes status; no-ops leave the file alone
+    if task.status != before:
+        tm._dirty = True
+
 def handle_get(args, tm):
     task = find_task_by_partial(tm, args.id)
     print(f"\n{'='*10} TASK DETAILS {'='*10}")
@@ -85,57 +94,46 @@ def handle_get(args, tm):
         if args.parameters == 'desc':
             print(f"Description:    {task.desc}")
         elif args.parameters == 'created':
-            print(f"Created: {task.created_time}")
+            print(f"Created: {format_datetime(task.created_time)}")
         elif args.parameters == 'target':
-            print(f"Target:  {task.target_time}")
+            print(f"Target:  {format_datetime(task.target_time)}")
         elif args.parameters == 'dead':
-            print(f"Dead: {task.dead_time}")
+            print(f"Dead: {format_datetime(task.dead_time)}")
         elif args.parameters == 'active':
             print(f"Active:  {task.active_time:.3f} secs")
         elif args.parameters == 'elapsed':
             print(f"Elapsed: {task.elapsed_time:.3f} secs")
         elif args.parameters == 'start':
             if task.start_times:
-                print(f"Start:   {task.start_time}")
+                print(f"Start:   {format_datetime(task.start_time)}")
             else:
                 print(f"Start: Task not Started Yet")
         elif args.parameters == 'pause':
             if task.pause_times:
-                print(f"Last pause:   {task.last_pause_time}")
+                print(f"Last pause:   {format_datetime(task.last_pause_time)}")
             else:
                 print(f"Last pause: Task not Started Yet")
         print('\n')
 
     if args.verbose and args.verbose > 0:
         print(f"Description:    {task.desc}")
-        print(f"Created: {task.created_time}")
-        print(f"Target:  {task.target_time}")
-        print(f"Dead: {task.dead_time}")
+        print(f"Created: {format_datetime(task.created_time)}")
+        print(f"Target:  {format_datetime(task.target_time)}")
+        print(f"Dead: {format_datetime(task.dead_time)}")
         print(f"Active:  {task.active_time:.3f} secs")
         print(f"Elapsed: {task.elapsed_time:.3f} secs")
         if task.start_times:
-            print(f"Start:   {task.start_time}")
+            print(f"Start:   {format_datetime(task.start_time)}")
         else:
             print(f"Start: Task not Started Yet")
         if task.pause_times:
-            print(f"Last pause:   {task.last_pause_time}")
+            print(f"Last pause:   {format_datetime(task.last_pause_time)}")
         else:
             print(f"Last pause: Task not Started Yet")
 
     print("="*34 + "\n")
 
-def main():
-    parser = argparse.ArgumentParser(
-            prog = 'ceyal',
-            description = " ++ ++ A task manager application ++ ++ "
-            )
-    subparsers = parser.add_subparsers(
-            dest = 'command',
-            required = True,
-            title = "Commands",
-            help = "action to perform"
-            )
-
+def _build_add(subparsers):
     add_p = subparsers.add_parser('add', help = "Create a New Task")
     add_p.add_argument('name', type = str, help = "Task Name")
     add_p.add_argument('-t','--target', type = str, help = "Target Time")
@@ -143,43 +141,69 @@ def main():
     add_p.add_argument('--dead', type = str, help = "Dead Time")
     add_p.set_defaults(func=handle_add)   
 
+def _build_list(subparsers):
     list_p = subparsers.add_parser('list', help = "List Tasks")
     list_p.add_argument('-o','--ongoing', action = 'store_true', help = "List all ongoing Tasks")
     list_p.add_argument('-a','--all', action = 'store_true', help = "List all Tasks")
     list_p.set_defaults(func=handle_list)   
 
+def _build_remove(subparsers):
     remove_p = subparsers.add_parser('remove', help = "Remove a Task")
     remove_p.add_argument('id', nargs='?', type = str, help = "Remove a task with ID") # Made optional for -a case
     remove_p.add_argument('-a','--all', action = 'store_true', help = "Remove all Tasks")
     remove_p.set_defaults(func=handle_remove)   
-    
-    start_p = subparsers.add_parser('start', help = "Start an existing Task")
-    start_p.add_argument('id', type = str, help = "Task ID")
-    start_p.set_defaults(func=handle_state_change)
-
-    pause_p = subparsers.add_parser('pause', help = "Pause an existing Task")
-    pause_p.add_argument('id', type = str, help = "Task ID")
-    pause_p.set_defaults(func=handle_state_change)
-
-    resume_p = subparsers.add_parser('resume', help = "Resume an existing Task")
-    resume_p.add_argument('id', type = str, help = "Task ID")
-    resume_p.set_defaults(func=handle_state_change)
 
-    complete_p = subparsers.add_parser('complete', help = "Complete an existing Task")
-    complete_p.add_argument('id', type = str, help = "Task ID")
-    complete_p.set_defaults(func=handle_state_change)
+def _build_state_change(command, help_text):
+    def build(subparsers):
+        state_p = subparsers.add_parser(command, help = help_text)
+        state_p.add_argument('id', type = str, help = "Task ID")
+        state_p.set_defaults(func=handle_state_change)
+    return build
 
+def _build_get(subparsers):
     get_p = subparsers.add_parser('get', help = "View a Task")
     get_p.add_argument('id', type = str, help = "Task ID")
     get_p.add_argument('parameters', type = str, nargs = '?', choices = AVAILABLE_PARAMETERS , help = "get specific details about a task")
     get_p.add_argument('-v','--verbose', action = 'count', help = "View details")
     get_p.set_defaults(func=handle_get)
 
-    
-    
+# subparsers are built on demand: only the invoked command pays for its setup
+BUILDERS = {
+    'add': _build_add,
+    'list': _build_list,
+    'remove': _build_remove,
+    'start': _build_state_change('start', "Start an existing Task"),
+    'pause': _build_state_change('pause', "Pause an existing Task"),
+    'resume': _build_state_change('resume', "Resume an existing Task"),
+    'complete': _build_state_change('complete', "Complete an existing Task"),
+    'get': _build_get,
+}
+
+def main():
+    parser = argparse.ArgumentParser(
+            prog = 'ceyal',
+            description = " ++ ++ A task manager application ++ ++ "
+            )
+    subparsers = parser.add_subparsers(
+            dest = 'command',
+            required = True,
+            title = "Commands",
+            help = "action to perform"
+            )
+    parser.add_argument('--pretty', action = 'store_true', help = "Save the task file indented")
+
+    # the command is the first token after the global options
+    cmd = next((a for a in sys.argv[1:] if a != '--pretty'), None)
+    if cmd in BUILDERS:
+        BUILDERS[cmd](subparsers)
+    else:
+        # help / unknown command: build everything so argparse can report it
+        for build in BUILDERS.values():
+            build(subparsers)
+
     args = parser.parse_args()
 
-    with TaskManager() as tm:
+    with TaskManager(pretty=args.pretty) as tm:
         if hasattr(args, 'func'):
             args.func(args, tm)
 
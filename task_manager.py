@@ -1,14 +1,25 @@
 import datetime as dt
 from enum import Enum
-import uuid
-import json
-import shutil
+import functools
 import os
+import time
 import sys
+from bisect import bisect_left, insort
+from collections.abc import MutableMapping
+from operator import attrgetter
 from pathlib import Path
 
+try:
+    import orjson
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # plain stdlib fallback, same on-disk format
+    orjson = None
+    import json
+    JSONDecodeError = json.JSONDecodeError
+
 APP_NAME = "ceyal"
 
+@functools.cache
 def get_default_db_path():
     if sys.platform.startswith("linux"):
         data_home = os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share")
@@ -20,7 +31,6 @@ def get_default_db_path():
         data_home = Path.home()  # fallback
     
     app_data_dir = Path(data_home) / APP_NAME
-    app_data_dir.mkdir(parents=True, exist_ok=True)
     return app_data_dir/"tasks.json"
 
 DB_FILE_PATH_DEFAULT = get_default_db_path()
@@ -31,78 +41,131 @@ class TaskStatus(str, Enum):
     PAUSED  = "paused"
     COMPLETED = "completed"
 
+#color coding ANSI escape codes [bright]
+COLORS = {
+    TaskStatus.ONGOING: "\033[94m",   # Blue
+    TaskStatus.COMPLETED: "\033[92m", # Green
+    TaskStatus.PENDING: "\033[91m",   # Red
+    TaskStatus.PAUSED: "\033[93m",    # Yellow
+}
+RESET = "\033[0m"
+
+# fully formatted "[ STATUS ]" column per status, built once
+_STATUS_FRAG = {s: f"[{COLORS.get(s, '')}{s.value.upper():^9}{RESET}]" for s in TaskStatus}
+
+def _to_epoch(value):
+    # timestamps are stored as epoch seconds; older databases hold ISO strings
+    if isinstance(value, str):
+        return dt.datetime.fromisoformat(value).timestamp()
+    return value
+
+def _to_epoch_list(values):
+    # lists are written whole, so they're either all ISO strings (older
+    # databases) or all floats; floats are copied without a per-item call
+    if values and isinstance(values[0], str):
+        return list(map(_to_epoch, values))
+    return list(values)
+
+def _new_task_id():
+    # secrets pulls in hmac/hashlib; only commands that create a task need it
+    import secrets
+    return secrets.token_hex(4)
+
 class Task:
+    __slots__ = ('name', 'id', 'target_time', 'desc', 'dead_time', 'created_time',
+                 'start_times', 'pause_times', 'is_complete', '_status_cache', '_status_dirty',
+                 '_committed_active')
+
     def __init__(self, name, target_time, desc=None, dead_time=None, id=None):
         self.name = name
         if id is None:
-            self.id = uuid.uuid4().hex
+            self.id = _new_task_id()
         else:
             self.id = id
         self.target_time = target_time
         self.desc = desc
         self.dead_time = dead_time
-        self.created_time = dt.datetime.now()
+        self.created_time = time.time()
         self.start_times = []
         self.pause_times = []
         self.is_complete = False
+        self._status_cache = None
+        self._status_dirty = True
+        self._committed_active = 0.0  # seconds from finished start/pause intervals
 
     @property
     def is_running(self):
         return (len(self.start_times) > len(self.pause_times) and not self.is_complete)
 
-    @property
-    def status(self):
+    def _status(self):
         if self.is_complete: return TaskStatus.COMPLETED
         if self.is_running: return TaskStatus.ONGOING
         if not self.start_times: return TaskStatus.PENDING
         return TaskStatus.PAUSED
 
+    @property
+    def status(self):
+        # recomputed only after one of the state-changing methods ran
+        if self._status_dirty:
+            self._status_cache = self._status()
+            self._status_dirty = False
+        return self._status_cache
+
     def start(self):
-        if self.status == TaskStatus.PENDING:
-            self.start_times.append(dt.datetime.now())
-            print(f"Task '{self.name}' started.")
-        elif self.status == TaskStatus.ONGOING:
+        running = len(self.start_times) > len(self.pause_times)
+        if self.is_complete or (self.start_times and not running):
+            print(f"Cannot start {self.status} task. Try 'resume'.")
+        elif running:
             print(f"Task '{self.name}' is already running.")
         else:
-            print(f"Cannot start {self.status} task. Try 'resume'.")
+            self.start_times.append(time.time())
+            self._status_dirty = True
+            print(f"Task '{self.name}' started.")
 
     def resume(self):
-        if self.status == TaskStatus.PAUSED:
-            self.start_times.append(dt.datetime.now())
-            print(f"Task '{self.name}' resumed.")
-        elif self.status == TaskStatus.ONGOING:
+        running = len(self.start_times) > len(self.pause_times)
+        if self.is_complete or not self.start_times:
+            print(f"Cannot resume {self.status} task.")
+        elif running:
             print(f"Task '{self.name}' is already running.")
         else:
-            print(f"Cannot resume {self.status} task.")
+            self.start_times.append(time.time())
+            self._status_dirty = True
+            print(f"Task '{self.name}' resumed.")
 
     def pause(self):
-        if self.status == TaskStatus.ONGOING:
-            self.pause_times.append(dt.datetime.now())
-            print(f"Task '{self.name}' paused.")
-        else:
+        running = len(self.start_times) > len(self.pause_times)
+        if self.is_complete or not running:
             print(f"Cannot pause {self.status} task.")
+        else:
+            now = time.time()
+            self._committed_active += now - self.start_times[-1]
+            self.pause_times.append(now)
+            self._status_dirty = True
+            print(f"Task '{self.name}' paused.")
 
     def complete(self):
-        if self.status == TaskStatus.ONGOING:
-            self.pause_times.append(dt.datetime.now())
-        if self.status == TaskStatus.COMPLETED:
+        if self.is_complete:
             print(f"Task '{self.name}' is already completed.")
             return
+        if len(self.start_times) > len(self.pause_times):  # running
+            now = time.time()
+            self._committed_active += now - self.start_times[-1]
+            self.pause_times.append(now)
         self.is_complete = True
+        self._status_dirty = True
         print(f"Task '{self.name}' completed.")
 
     @property
     def elapsed_time(self):
         if not self.start_times: return 0.0
-        return (dt.datetime.now() - self.start_times[0]).total_seconds()
+        return time.time() - self.start_times[0]
 
     @property
     def active_time(self):
-        active_t = 0.0
-        for start, pause in zip(self.start_times, self.pause_times):
-            active_t += (pause - start).total_seconds()
+        active_t = self._committed_active
         if self.is_running:
-            active_t += (dt.datetime.now() - self.start_times[-1]).total_seconds()
+            active_t += time.time() - self.start_times[-1]
         return active_t
 
     @property
@@ -116,12 +179,12 @@ class Task:
     def to_dict(self):
         return {
             "name": self.name, "id": self.id,
-            "target_time": self.target_time.isoformat() if self.target_time else None,
+            "target_time": self.target_time,
             "desc": self.desc,
-            "dead_time": self.dead_time.isoformat() if self.dead_time else None,
-            "created_time": self.created_time.isoformat(),
-            "start_times": [t.isoformat() for t in self.start_times],
-            "pause_times": [t.isoformat() for t in self.pause_times],
+            "dead_time": self.dead_time,
+            "created_time": self.created_time,
+            "start_times": list(self.start_times),
+            "pause_times": list(self.pause_times),
             "is_complete": self.is_complete
         }
 
@@ -129,91 +192,219 @@ class Task:
     def from_dict(cls, data):
         task = cls(
             name=data['name'],
-            target_time=dt.datetime.fromisoformat(data['target_time']) if data['target_time'] else None,
+            target_time=_to_epoch(data['target_time']),
             desc=data['desc'],
-            dead_time=dt.datetime.fromisoformat(data['dead_time']) if data['dead_time'] else None,
+            dead_time=_to_epoch(data['dead_time']),
             id=data['id']
         )
-        task.created_time = dt.datetime.fromisoformat(data['created_time'])
-        task.start_times = [dt.datetime.fromisoformat(t) for t in data['start_times']]
-        task.pause_times = [dt.datetime.fromisoformat(t) for t in data['pause_times']]
+        task.created_time = _to_epoch(data['created_time'])
+        task.start_times = _to_epoch_list(data['start_times'])
+        task.pause_times = _to_epoch_list(data['pause_times'])
         task.is_complete = data['is_complete']
+        task._status_dirty = True
+        task._committed_active = sum((p - s for s, p in zip(task.start_times, task.pause_times)), 0.0)
         return task
 
+class _LazyTaskDict(MutableMapping):
+    """task id -> Task, built from the raw on-disk dicts only when accessed"""
+
+    def __init__(self, raw=None):
+        # _raw keeps every id in file/insertion order; tasks added this run map to None
+        self._raw = raw if raw is not None else {}
+        self._materialized = {}
+
+    def __getitem__(self, task_id):
+        try:
+            return self._materialized[task_id]
+        except KeyError:
+            task = self._materialized[task_id] = Task.from_dict(self._raw[task_id])
+            return task
+
+    def __setitem__(self, task_id, task):
+        self._raw.setdefault(task_id, None)
+        self._materialized[task_id] = task
+
+    def __delitem__(self, task_id):
+        del self._raw[task_id]
+        self._materialized.pop(task_id, None)
+
+    def __iter__(self):
+        return iter(self._raw)
+
+    def __reversed__(self):
+        return reversed(self._raw)
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __contains__(self, task_id):
+        return task_id in self._raw
+
+    def get(self, task_id, default=None):
+        # Mapping.get would also swallow a KeyError from Task.from_dict on a
+        # malformed entry; only an unknown id should give the default
+        if task_id not in self._raw:
+            return default
+        return self[task_id]
+
+    def clear(self):
+        self._raw.clear()
+        self._materialized.clear()
+
+    def payload(self):
+        # untouched tasks go back out exactly as they were read
+        materialized = self._materialized
+        return {tid: materialized[tid].to_dict() if tid in materialized else raw
+                for tid, raw in self._raw.items()}
+
 class TaskManager:
-    def __init__(self, db_file=DB_FILE_PATH_DEFAULT):
-        self.tasks = {}
+    # directories already created this process; the mkdir waits for the first save
+    _ensured_dirs = set()
+
+    def __init__(self, db_file=DB_FILE_PATH_DEFAULT, pretty=False):
+        self.tasks = _LazyTaskDict()
         self.db_file = db_file
+        self.pretty = pretty  # indent the saved JSON; compact by default
+        self._dirty = False  # set by anything that changes what's on disk
+        self._sorted_ids = []  # all task ids, kept sorted for prefix lookups
+        # tasks are appended as they're created and saved in that order, so the
+        # mapping is normally already sorted by created_time
+        self._sorted = True
 
     def __enter__(self):
         self.load_tasks()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        self.save_tasks()
+        if self._dirty:
+            self.save_tasks()
         if exc_type:
             print(f"Program Crashed due to {exc_value}.")
             return False 
         return True
 
     def save_tasks(self):
+        payload = self.tasks.payload()
+        if not self._sorted:
+            # restore creation order on disk so the next load can trust it again
+            tasks = self.tasks
+            payload = {tid: payload[tid] for tid in sorted(payload, key=lambda tid: tasks[tid].created_time)}
+        if orjson is not None:
+            buf = orjson.dumps(payload, option=orjson.OPT_INDENT_2 if self.pretty else 0)
+        elif self.pretty:
+            buf = json.dumps(payload, indent=2).encode()
+        else:
+            buf = json.dumps(payload, separators=(',', ':')).encode()
+
+        db_dir = self.db_file.parent
+        if db_dir not in TaskManager._ensured_dirs:
+            db_dir.mkdir(parents=True, exist_ok=True)
+            TaskManager._ensured_dirs.add(db_dir)
+
+        # write aside and make it durable, then swap it in with a single rename;
+        # tasks.json exists throughout
+        tmp_path = self.db_file.with_suffix(".tmp")
         try:
-            backup_path = self.db_file.with_suffix(self.db_file.suffix + ".bak")
-            shutil.copy(self.db_file, backup_path)
-        except FileNotFoundError:
-            pass
+            with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                f.write(buf)
+                f.flush()
+                os.fsync(f.fileno())
+            self._backup()
+            os.replace(tmp_path, self.db_file)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
-        data_write = {tid: t.to_dict() for tid, t in self.tasks.items()}
-        with open(self.db_file, 'w') as f:
-            json.dump(data_write, f, indent=4)
+    def _backup(self):
+        # the new backup is built under a temporary name and then renamed onto
+        # .bak, so the previous backup survives until a new one exists
+        backup_path = self.db_file.with_suffix(self.db_file.suffix + ".bak")
+        staging_path = self.db_file.with_suffix(self.db_file.suffix + ".bak.tmp")
+        staging_path.unlink(missing_ok=True)
+        try:
+            os.link(self.db_file, staging_path)
+        except FileNotFoundError:
+            return  # first save, nothing to back up
+        except OSError:
+            # no hard links on this filesystem (FAT/exFAT, some network shares)
+            import shutil
+            try:
+                shutil.copy2(self.db_file, staging_path)
+            except BaseException:
+                staging_path.unlink(missing_ok=True)
+                raise
+        os.replace(staging_path, backup_path)
 
     def load_tasks(self):
         try:
-            with open(self.db_file, 'r') as f:
-                data_read = json.load(f)
-            self.tasks = {tid: Task.from_dict(t_data) for tid, t_data in data_read.items()}
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.tasks = {}
+            with open(self.db_file, 'rb') as f:
+                raw = f.read()
+            data_read = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self.tasks = _LazyTaskDict(data_read)
+        except (FileNotFoundError, JSONDecodeError):
+            self.tasks = _LazyTaskDict()
+        self._sorted_ids = sorted(self.tasks)
 
     def add(self, name, target_time, desc=None, dead_time=None):
         task = Task(name, target_time, desc, dead_time)
+        # redraw if the id equals or prefixes an existing one (older databases
+        # hold 32-char ids); otherwise the new task could never be addressed
+        while self.ids_with_prefix(task.id):
+            task.id = _new_task_id()
+        if self._sorted and self.tasks:
+            newest = self.tasks[next(reversed(self.tasks))]
+            if task.created_time < newest.created_time:  # clock went backwards
+                self._sorted = False
         self.tasks[task.id] = task
+        insort(self._sorted_ids, task.id)
+        self._dirty = True
         print(f"Added Task: {task.name} ({task.id[:6]})")
         return task.id
 
     def remove(self, task_id):
-        if task_id in self.tasks:
+        try:
             del self.tasks[task_id]
-        else:
-            raise KeyError(f"Task {task_id} not found")
+        except KeyError:
+            raise KeyError(f"Task {task_id} not found") from None
+        del self._sorted_ids[bisect_left(self._sorted_ids, task_id)]
+        self._dirty = True
+
+    def clear(self):
+        self.tasks.clear()
+        self._sorted_ids.clear()
+        self._sorted = True
+        self._dirty = True
 
     def get(self, task_id):
         return self.tasks.get(task_id)
 
+    def ids_with_prefix(self, prefix):
+        ids = self._sorted_ids
+        lo = bisect_left(ids, prefix)
+        hi = bisect_left(ids, prefix + "\uffff")
+        return ids[lo:hi]
+
     def list_all(self, show_all=False, filter_status=None):
-        print(f"\n{'='*10} CEYAL TASK LIST {'='*10}")
+        lines = [f"\n{'='*10} CEYAL TASK LIST {'='*10}"]
         
-        #sorting by created time
-        sorted_tasks = sorted(self.tasks.values(), key=lambda x: x.created_time)
-        count = 0
-
-        for task in sorted_tasks:
-            if filter_status and task.status != filter_status:
-                continue
-            if not show_all and not filter_status and task.status == TaskStatus.COMPLETED:
-                continue
-
-            #color coding ANSI escape codes [bright]
-            status_color = ""
-            if task.status == TaskStatus.ONGOING: status_color = "\033[94m" # Blue
-            elif task.status == TaskStatus.COMPLETED: status_color = "\033[92m" # Green
-            elif task.status == TaskStatus.PENDING: status_color = "\033[91m" # Red
-            elif task.status == TaskStatus.PAUSED: status_color = "\033[93m" # Yellow
-            reset = "\033[0m"
-
-            print(f"[{status_color}{task.status.value.upper():^9}{reset}] {task.name} (ID: {task.id[:6]})")
-            count += 1
+        # the flags don't change during the loop, so pick the filter once
+        if filter_status:
+            visible = lambda status: status == filter_status
+        elif show_all:
+            visible = lambda status: True
+        else:
+            visible = lambda status: status != TaskStatus.COMPLETED
+
+        sorted_tasks = list(self.tasks.values())
+        if not self._sorted:
+            sorted_tasks.sort(key=attrgetter('created_time'))
+        # status is read once per task and carried along for formatting
+        shown = [(status, task) for task in sorted_tasks if visible(status := task.status)]
+
+        lines.extend(f"{_STATUS_FRAG[status]} {task.name} (ID: {task.id[:6]})" for status, task in shown)
         
-        if count == 0:
-            print("  No tasks found.")
-        print("="*37 + "\n")
+        if not shown:
+            lines.append("  No tasks found.")
+        lines.append("="*37 + "\n")
+        # one write for the whole listing instead of a print per task
+        sys.stdout.write("\n".join(lines) + "\n")